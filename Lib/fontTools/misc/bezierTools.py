@@ -2,10 +2,11 @@
 """fontTools.misc.bezierTools.py -- tools for working with Bezier path segments.
 """
 
-from fontTools.misc.arrayTools import calcBounds, sectRect, rectArea
-from fontTools.misc.transform import Identity
+from fontTools.misc.arrayTools import calcBounds, sectRect
+from fontTools.misc.transform import _normSinCos
 import math
 from collections import namedtuple
+from functools import lru_cache
 
 try:
     import cython
@@ -18,14 +19,18 @@ except (AttributeError, ImportError):
     COMPILED = False
 
 
+# Intersections are built positionally within this module, which is notably
+# faster than passing the fields by keyword.
 Intersection = namedtuple("Intersection", ["pt", "t1", "t2"])
 
 
 __all__ = [
     "approximateCubicArcLength",
     "approximateCubicArcLengthC",
+    "approximateCubicArcLengthBatch",
     "approximateQuadraticArcLength",
     "approximateQuadraticArcLengthC",
+    "approximateQuadraticArcLengthBatch",
     "calcCubicArcLength",
     "calcCubicArcLengthC",
     "calcQuadraticArcLength",
@@ -49,6 +54,7 @@ __all__ = [
     "lineLineIntersections",
     "curveLineIntersections",
     "curveCurveIntersections",
+    "curveCurveIntersectionsBatch",
     "segmentSegmentIntersections",
 ]
 
@@ -72,35 +78,6 @@ def calcCubicArcLength(pt1, pt2, pt3, pt4, tolerance=0.005):
     )
 
 
-def _split_cubic_into_two(p0, p1, p2, p3):
-    mid = (p0 + 3 * (p1 + p2) + p3) * 0.125
-    deriv3 = (p3 + p2 - p1 - p0) * 0.125
-    return (
-        (p0, (p0 + p1) * 0.5, mid - deriv3, mid),
-        (mid, mid + deriv3, (p2 + p3) * 0.5, p3),
-    )
-
-
-@cython.returns(cython.double)
-@cython.locals(
-    p0=cython.complex,
-    p1=cython.complex,
-    p2=cython.complex,
-    p3=cython.complex,
-)
-@cython.locals(mult=cython.double, arch=cython.double, box=cython.double)
-def _calcCubicArcLengthCRecurse(mult, p0, p1, p2, p3):
-    arch = abs(p0 - p3)
-    box = abs(p0 - p1) + abs(p1 - p2) + abs(p2 - p3)
-    if arch * mult >= box:
-        return (arch + box) * 0.5
-    else:
-        one, two = _split_cubic_into_two(p0, p1, p2, p3)
-        return _calcCubicArcLengthCRecurse(mult, *one) + _calcCubicArcLengthCRecurse(
-            mult, *two
-        )
-
-
 @cython.returns(cython.double)
 @cython.locals(
     pt1=cython.complex,
@@ -111,6 +88,15 @@ def _calcCubicArcLengthCRecurse(mult, p0, p1, p2, p3):
 @cython.locals(
     tolerance=cython.double,
     mult=cython.double,
+    total=cython.double,
+    arch=cython.double,
+    box=cython.double,
+    p0=cython.complex,
+    p1=cython.complex,
+    p2=cython.complex,
+    p3=cython.complex,
+    mid=cython.complex,
+    deriv3=cython.complex,
 )
 def calcCubicArcLengthC(pt1, pt2, pt3, pt4, tolerance=0.005):
     """Calculates the arc length for a cubic Bezier segment.
@@ -123,7 +109,22 @@ def calcCubicArcLengthC(pt1, pt2, pt3, pt4, tolerance=0.005):
         Arc length value.
     """
     mult = 1.0 + 1.5 * tolerance  # The 1.5 is a empirical hack; no math
-    return _calcCubicArcLengthCRecurse(mult, pt1, pt2, pt3, pt4)
+    total = 0.0
+    # Subdivide iteratively rather than recursively, to save on function calls.
+    stack = [(pt1, pt2, pt3, pt4)]
+    while stack:
+        p0, p1, p2, p3 = stack.pop()
+        arch = abs(p0 - p3)
+        box = abs(p0 - p1) + abs(p1 - p2) + abs(p2 - p3)
+        if arch * mult >= box:
+            total += (arch + box) * 0.5
+        else:
+            mid = (p0 + 3 * (p1 + p2) + p3) * 0.125
+            deriv3 = (p3 + p2 - p1 - p0) * 0.125
+            # Push the second half first, so that the first half is measured first.
+            stack.append((mid, mid + deriv3, (p2 + p3) * 0.5, p3))
+            stack.append((p0, (p0 + p1) * 0.5, mid - deriv3, mid))
+    return total
 
 
 epsilonDigits = 6
@@ -145,7 +146,7 @@ def _dot(v1, v2):
 def _intSecAtan(x):
     # In : sympy.integrate(sp.sec(sp.atan(x)))
     # Out: x*sqrt(x**2 + 1)/2 + asinh(x)/2
-    return x * math.sqrt(x**2 + 1) / 2 + math.asinh(x) / 2
+    return x * math.hypot(x, 1.0) / 2 + math.asinh(x) / 2
 
 
 def calcQuadraticArcLength(pt1, pt2, pt3):
@@ -191,7 +192,6 @@ def calcQuadraticArcLength(pt1, pt2, pt3):
     d0=cython.complex,
     d1=cython.complex,
     d=cython.complex,
-    n=cython.complex,
 )
 @cython.locals(
     scale=cython.double,
@@ -218,16 +218,15 @@ def calcQuadraticArcLengthC(pt1, pt2, pt3):
     d0 = pt2 - pt1
     d1 = pt3 - pt2
     d = d1 - d0
-    n = d * 1j
-    scale = abs(n)
-    if scale == 0.0:
-        return abs(pt3 - pt1)
-    origDist = _dot(n, d0)
+    # This is _dot(d * 1j, d0), the cross product of d0 and d1: test it
+    # first, as it is cheap and collinear points need no integration.
+    origDist = d.real * d0.imag - d.imag * d0.real
     if abs(origDist) < epsilon:
         if _dot(d0, d1) >= 0:
             return abs(pt3 - pt1)
         a, b = abs(d0), abs(d1)
         return (a * a + b * b) / (a + b)
+    scale = abs(d)
     x0 = _dot(d, d0) / origDist
     x1 = _dot(d, d1) / origDist
     Len = abs(2 * (_intSecAtan(x1) - _intSecAtan(x0)) * origDist / (scale * (x1 - x0)))
@@ -266,7 +265,9 @@ def approximateQuadraticArcLengthC(pt1, pt2, pt3):
     """Calculates the arc length for a quadratic Bezier segment.
 
     Uses Gauss-Legendre quadrature for a branch-free approximation.
-    See :func:`calcQuadraticArcLength` for a slower but more accurate result.
+    See :func:`calcQuadraticArcLength` for a slower but more accurate result,
+    and :func:`approximateQuadraticArcLengthBatch` for measuring many segments
+    at once.
 
     Args:
         pt1: Start point of the Bezier as a complex number.
@@ -284,6 +285,8 @@ def approximateQuadraticArcLengthC(pt1, pt2, pt3):
 
     # abs(BezierCurveC[2].diff(t).subs({t:T})) for T in sorted(.5, .5±sqrt(3/5)/2),
     # weighted 5/18, 8/18, 5/18 respectively.
+    # The same terms are tabulated in _QUADRATIC_LEGENDRE_COEFFS; they are
+    # unrolled here as that is about twice as fast as looping over the table.
     v0 = abs(
         -0.492943519233745 * pt1 + 0.430331482911935 * pt2 + 0.0626120363218102 * pt3
     )
@@ -295,6 +298,38 @@ def approximateQuadraticArcLengthC(pt1, pt2, pt3):
     return v0 + v1 + v2
 
 
+# The Gauss-Legendre terms of approximateQuadraticArcLengthC, expressed as
+# (weight, coefficients) so that the derivative at each node is the dot product
+# of the coefficients with the control points.
+_QUADRATIC_LEGENDRE_WEIGHTS = (1.0, 0.4444444444444444, 1.0)
+_QUADRATIC_LEGENDRE_COEFFS = (
+    (-0.492943519233745, 0.430331482911935, 0.0626120363218102),
+    (-1.0, 0.0, 1.0),
+    (-0.0626120363218102, -0.430331482911935, 0.492943519233745),
+)
+
+
+def approximateQuadraticArcLengthBatch(pts):
+    """Approximates the arc lengths of many quadratic Bezier segments at once.
+
+    This is the vectorized equivalent of :func:`approximateQuadraticArcLengthC`,
+    and requires NumPy.
+
+    Args:
+        pts: An array-like of shape ``(N, 3)`` holding the control points of
+            ``N`` Beziers as complex numbers.
+
+    Returns:
+        A NumPy array of shape ``(N,)`` with the approximate arc lengths.
+    """
+    import numpy as np
+
+    pts = np.asarray(pts, dtype=complex).reshape(-1, 3)
+    coeffs = np.array(_QUADRATIC_LEGENDRE_COEFFS)
+    weights = np.array(_QUADRATIC_LEGENDRE_WEIGHTS)
+    return np.abs(pts @ coeffs.T) @ weights
+
+
 def calcQuadraticBounds(pt1, pt2, pt3):
     """Calculates the bounding rectangle for a quadratic Bezier segment.
 
@@ -376,6 +411,9 @@ def approximateCubicArcLength(pt1, pt2, pt3, pt4):
 def approximateCubicArcLengthC(pt1, pt2, pt3, pt4):
     """Approximates the arc length for a cubic Bezier segment.
 
+    See :func:`approximateCubicArcLengthBatch` for measuring many segments
+    at once.
+
     Args:
         pt1,pt2,pt3,pt4: Control points of the Bezier as complex numbers.
 
@@ -390,6 +428,8 @@ def approximateCubicArcLengthC(pt1, pt2, pt3, pt4):
 
     # abs(BezierCurveC[3].diff(t).subs({t:T})) for T in sorted(0, .5±(3/7)**.5/2, .5, 1),
     # weighted 1/20, 49/180, 32/90, 49/180, 1/20 respectively.
+    # The same terms are tabulated in _CUBIC_LOBATTO_COEFFS; they are
+    # unrolled here as that is about twice as fast as looping over the table.
     v0 = abs(pt2 - pt1) * 0.15
     v1 = abs(
         -0.558983582205757 * pt1
@@ -409,6 +449,41 @@ def approximateCubicArcLengthC(pt1, pt2, pt3, pt4):
     return v0 + v1 + v2 + v3 + v4
 
 
+# The Gauss-Lobatto terms of approximateCubicArcLengthC, expressed as
+# (weight, coefficients) so that the derivative at each node is the dot product
+# of the coefficients with the control points.
+_CUBIC_LOBATTO_WEIGHTS = (0.15, 1.0, 0.26666666666666666, 1.0, 0.15)
+_CUBIC_LOBATTO_COEFFS = (
+    (-1.0, 1.0, 0.0, 0.0),
+    (-0.558983582205757, 0.325650248872424, 0.208983582205757, 0.024349751127576),
+    (-1.0, -1.0, 1.0, 1.0),
+    (-0.024349751127576, -0.208983582205757, -0.325650248872424, 0.558983582205757),
+    (0.0, 0.0, -1.0, 1.0),
+)
+
+
+def approximateCubicArcLengthBatch(pts):
+    """Approximates the arc lengths of many cubic Bezier segments at once.
+
+    This is the vectorized equivalent of :func:`approximateCubicArcLengthC`,
+    and requires NumPy. Prefer it over calling the scalar function in a loop
+    when measuring a large number of segments.
+
+    Args:
+        pts: An array-like of shape ``(N, 4)`` holding the control points of
+            ``N`` Beziers as complex numbers.
+
+    Returns:
+        A NumPy array of shape ``(N,)`` with the approximate arc lengths.
+    """
+    import numpy as np
+
+    pts = np.asarray(pts, dtype=complex).reshape(-1, 4)
+    coeffs = np.array(_CUBIC_LOBATTO_COEFFS)
+    weights = np.array(_CUBIC_LOBATTO_WEIGHTS)
+    return np.abs(pts @ coeffs.T) @ weights
+
+
 def calcCubicBounds(pt1, pt2, pt3, pt4):
     """Calculates the bounding rectangle for a quadratic Bezier segment.
 
@@ -427,20 +502,29 @@ def calcCubicBounds(pt1, pt2, pt3, pt4):
         >>> print("%f %f %f %f" % calcCubicBounds((50, 0), (0, 100), (100, 100), (50, 0)))
         35.566243 0.000000 64.433757 75.000000
     """
-    (ax, ay), (bx, by), (cx, cy), (dx, dy) = calcCubicParameters(pt1, pt2, pt3, pt4)
+    # Inline calcCubicParameters, to avoid packing and unpacking tuples.
+    x1, y1 = pt1
+    x2, y2 = pt2
+    x3, y3 = pt3
+    x4, y4 = pt4
+    cx = (x2 - x1) * 3.0
+    cy = (y2 - y1) * 3.0
+    bx = (x3 - x2) * 3.0 - cx
+    by = (y3 - y2) * 3.0 - cy
+    ax = x4 - x1 - cx - bx
+    ay = y4 - y1 - cy - by
     # calc first derivative
-    ax3 = ax * 3.0
-    ay3 = ay * 3.0
-    bx2 = bx * 2.0
-    by2 = by * 2.0
-    xRoots = [t for t in solveQuadratic(ax3, bx2, cx) if 0 <= t < 1]
-    yRoots = [t for t in solveQuadratic(ay3, by2, cy) if 0 <= t < 1]
-    roots = xRoots + yRoots
+    roots = [
+        t
+        for t in _solveQuadratic(ax * 3.0, bx * 2.0, cx)
+        + _solveQuadratic(ay * 3.0, by * 2.0, cy)
+        if 0 <= t < 1
+    ]
 
     points = [
         (
-            ax * t * t * t + bx * t * t + cx * t + dx,
-            ay * t * t * t + by * t * t + cy * t + dy,
+            ax * t * t * t + bx * t * t + cx * t + x1,
+            ay * t * t * t + by * t * t + cy * t + y1,
         )
         for t in roots
     ] + [pt1, pt4]
@@ -540,7 +624,7 @@ def splitQuadratic(pt1, pt2, pt3, where, isHorizontal):
         ((50, 50), (75, 50), (100, 0))
     """
     a, b, c = calcQuadraticParameters(pt1, pt2, pt3)
-    solutions = solveQuadratic(
+    solutions = _solveQuadratic(
         a[isHorizontal], b[isHorizontal], c[isHorizontal] - where
     )
     solutions = sorted(t for t in solutions if 0 <= t < 1)
@@ -698,17 +782,32 @@ def splitCubicIntoTwoAtTC(pt1, pt2, pt3, pt4, t):
     return ((pt1, pt2, off1, pointAtT), (pointAtT, off2, pt3, pt4))
 
 
+@cython.locals(
+    ax=cython.double,
+    ay=cython.double,
+    bx=cython.double,
+    by=cython.double,
+    cx=cython.double,
+    cy=cython.double,
+    t1=cython.double,
+    t2=cython.double,
+    delta=cython.double,
+    delta_2=cython.double,
+    a1x=cython.double,
+    a1y=cython.double,
+    b1x=cython.double,
+    b1y=cython.double,
+    t1_2=cython.double,
+    c1x=cython.double,
+    c1y=cython.double,
+)
 def _splitQuadraticAtT(a, b, c, *ts):
-    ts = list(ts)
     segments = []
-    ts.insert(0, 0.0)
-    ts.append(1.0)
     ax, ay = a
     bx, by = b
     cx, cy = c
-    for i in range(len(ts) - 1):
-        t1 = ts[i]
-        t2 = ts[i + 1]
+    t1 = 0.0
+    for t2 in ts + (1.0,):
         delta = t2 - t1
         # calc new a, b and c
         delta_2 = delta * delta
@@ -720,23 +819,57 @@ def _splitQuadraticAtT(a, b, c, *ts):
         c1x = ax * t1_2 + bx * t1 + cx
         c1y = ay * t1_2 + by * t1 + cy
 
-        pt1, pt2, pt3 = calcQuadraticPoints((a1x, a1y), (b1x, b1y), (c1x, c1y))
-        segments.append((pt1, pt2, pt3))
+        # calcQuadraticPoints, inlined
+        segments.append(
+            (
+                (c1x, c1y),
+                ((b1x * 0.5) + c1x, (b1y * 0.5) + c1y),
+                (a1x + b1x + c1x, a1y + b1y + c1y),
+            )
+        )
+        t1 = t2
     return segments
 
 
+@cython.locals(
+    ax=cython.double,
+    ay=cython.double,
+    bx=cython.double,
+    by=cython.double,
+    cx=cython.double,
+    cy=cython.double,
+    dx=cython.double,
+    dy=cython.double,
+    t1=cython.double,
+    t2=cython.double,
+    delta=cython.double,
+    delta_2=cython.double,
+    delta_3=cython.double,
+    t1_2=cython.double,
+    t1_3=cython.double,
+    a1x=cython.double,
+    a1y=cython.double,
+    b1x=cython.double,
+    b1y=cython.double,
+    c1x=cython.double,
+    c1y=cython.double,
+    d1x=cython.double,
+    d1y=cython.double,
+    x2=cython.double,
+    y2=cython.double,
+    x3=cython.double,
+    y3=cython.double,
+    x4=cython.double,
+    y4=cython.double,
+)
 def _splitCubicAtT(a, b, c, d, *ts):
-    ts = list(ts)
-    ts.insert(0, 0.0)
-    ts.append(1.0)
     segments = []
     ax, ay = a
     bx, by = b
     cx, cy = c
     dx, dy = d
-    for i in range(len(ts) - 1):
-        t1 = ts[i]
-        t2 = ts[i + 1]
+    t1 = 0.0
+    for t2 in ts + (1.0,):
         delta = t2 - t1
 
         delta_2 = delta * delta
@@ -753,10 +886,15 @@ def _splitCubicAtT(a, b, c, d, *ts):
         c1y = (2 * by * t1 + cy + 3 * ay * t1_2) * delta
         d1x = ax * t1_3 + bx * t1_2 + cx * t1 + dx
         d1y = ay * t1_3 + by * t1_2 + cy * t1 + dy
-        pt1, pt2, pt3, pt4 = calcCubicPoints(
-            (a1x, a1y), (b1x, b1y), (c1x, c1y), (d1x, d1y)
-        )
-        segments.append((pt1, pt2, pt3, pt4))
+        # calcCubicPoints, inlined
+        x2 = (c1x / 3.0) + d1x
+        y2 = (c1y / 3.0) + d1y
+        x3 = (b1x + c1x) / 3.0 + x2
+        y3 = (b1y + c1y) / 3.0 + y2
+        x4 = a1x + d1x + c1x + b1x
+        y4 = a1y + d1y + c1y + b1y
+        segments.append(((d1x, d1y), (x2, y2), (x3, y3), (x4, y4)))
+        t1 = t2
     return segments
 
 
@@ -776,12 +914,8 @@ def _splitCubicAtT(a, b, c, d, *ts):
     d1=cython.complex,
 )
 def _splitCubicAtTC(a, b, c, d, *ts):
-    ts = list(ts)
-    ts.insert(0, 0.0)
-    ts.append(1.0)
-    for i in range(len(ts) - 1):
-        t1 = ts[i]
-        t2 = ts[i + 1]
+    t1 = 0.0
+    for t2 in ts + (1.0,):
         delta = t2 - t1
 
         delta_2 = delta * delta
@@ -796,6 +930,7 @@ def _splitCubicAtTC(a, b, c, d, *ts):
         d1 = a * t1_3 + b * t1_2 + c * t1 + d
         pt1, pt2, pt3, pt4 = calcCubicPointsC(a1, b1, c1, d1)
         yield (pt1, pt2, pt3, pt4)
+        t1 = t2
 
 
 #
@@ -819,25 +954,60 @@ def solveQuadratic(a, b, c, sqrt=sqrt):
         A list of roots. Note that the returned list is neither guaranteed to
         be sorted nor to contain unique values!
     """
+    return list(_solveQuadratic(a, b, c, sqrt))
+
+
+# Internal callers use this directly, as they only iterate over the roots
+# and have no need for a list.
+@cython.locals(
+    a=cython.double,
+    b=cython.double,
+    c=cython.double,
+    DD=cython.double,
+    rDD=cython.double,
+)
+def _solveQuadratic(a, b, c, sqrt=sqrt):
     if abs(a) < epsilon:
         if abs(b) < epsilon:
             # We have a non-equation; therefore, we have no valid solution
-            roots = []
+            roots = ()
         else:
             # We have a linear equation with 1 root.
-            roots = [-c / b]
+            roots = (-c / b,)
     else:
         # We have a true quadratic equation.  Apply the quadratic formula to find two roots.
         DD = b * b - 4.0 * a * c
         if DD >= 0.0:
             rDD = sqrt(DD)
-            roots = [(-b + rDD) / 2.0 / a, (-b - rDD) / 2.0 / a]
+            roots = ((-b + rDD) / 2.0 / a, (-b - rDD) / 2.0 / a)
         else:
             # complex roots, ignore
-            roots = []
+            roots = ()
     return roots
 
 
+@cython.locals(
+    a=cython.double,
+    b=cython.double,
+    c=cython.double,
+    d=cython.double,
+    a1=cython.double,
+    a2=cython.double,
+    a3=cython.double,
+    Q=cython.double,
+    R=cython.double,
+    R2=cython.double,
+    Q3=cython.double,
+    R2_Q3=cython.double,
+    cosTheta=cython.double,
+    theta=cython.double,
+    rQ2=cython.double,
+    a1_3=cython.double,
+    x=cython.double,
+    x0=cython.double,
+    x1=cython.double,
+    x2=cython.double,
+)
 def solveCubic(a, b, c, d):
     """Solve a cubic equation.
 
@@ -900,13 +1070,25 @@ def solveCubic(a, b, c, d):
         return [x, x, x]
     elif R2_Q3 <= epsilon * 0.5:
         # The epsilon * .5 above ensures that Q3 is not zero.
-        theta = acos(max(min(R / sqrt(Q3), 1.0), -1.0))
+        cosTheta = R / sqrt(Q3)
+        # Rounding errors can push cosTheta slightly out of acos' domain.
+        if cosTheta > 1.0:
+            cosTheta = 1.0
+        elif cosTheta < -1.0:
+            cosTheta = -1.0
+        theta = acos(cosTheta)
         rQ2 = -2.0 * sqrt(Q)
         a1_3 = a1 / 3.0
         x0 = rQ2 * cos(theta / 3.0) - a1_3
         x1 = rQ2 * cos((theta + 2.0 * pi) / 3.0) - a1_3
         x2 = rQ2 * cos((theta + 4.0 * pi) / 3.0) - a1_3
-        x0, x1, x2 = sorted([x0, x1, x2])
+        # Sort the three roots without building a list.
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if x1 > x2:
+            x1, x2 = x2, x1
+        if x0 > x1:
+            x0, x1 = x1, x0
         # Merge roots that are close-enough
         if x1 - x0 < epsilon and x2 - x1 < epsilon:
             x0 = x1 = x2 = round((x0 + x1 + x2) / 3.0, epsilonDigits)
@@ -1040,9 +1222,22 @@ def linePointAtT(pt1, pt2, t):
     Returns:
         A 2D tuple with the coordinates of the point.
     """
-    return ((pt1[0] * (1 - t) + pt2[0] * t), (pt1[1] * (1 - t) + pt2[1] * t))
+    _1_t = 1 - t
+    return ((pt1[0] * _1_t + pt2[0] * t), (pt1[1] * _1_t + pt2[1] * t))
 
 
+@cython.locals(
+    t=cython.double,
+    x1=cython.double,
+    y1=cython.double,
+    x2=cython.double,
+    y2=cython.double,
+    x3=cython.double,
+    y3=cython.double,
+    t2=cython.double,
+    _1_t=cython.double,
+    _1_t_2=cython.double,
+)
 def quadraticPointAtT(pt1, pt2, pt3, t):
     """Finds the point at time `t` on a quadratic curve.
 
@@ -1053,11 +1248,31 @@ def quadraticPointAtT(pt1, pt2, pt3, t):
     Returns:
         A 2D tuple with the coordinates of the point.
     """
-    x = (1 - t) * (1 - t) * pt1[0] + 2 * (1 - t) * t * pt2[0] + t * t * pt3[0]
-    y = (1 - t) * (1 - t) * pt1[1] + 2 * (1 - t) * t * pt2[1] + t * t * pt3[1]
+    x1, y1 = pt1
+    x2, y2 = pt2
+    x3, y3 = pt3
+    t2 = t * t
+    _1_t = 1 - t
+    _1_t_2 = _1_t * _1_t
+    x = _1_t_2 * x1 + 2 * _1_t * t * x2 + t2 * x3
+    y = _1_t_2 * y1 + 2 * _1_t * t * y2 + t2 * y3
     return (x, y)
 
 
+@cython.locals(
+    t=cython.double,
+    x1=cython.double,
+    y1=cython.double,
+    x2=cython.double,
+    y2=cython.double,
+    x3=cython.double,
+    y3=cython.double,
+    x4=cython.double,
+    y4=cython.double,
+    t2=cython.double,
+    _1_t=cython.double,
+    _1_t_2=cython.double,
+)
 def cubicPointAtT(pt1, pt2, pt3, pt4, t):
     """Finds the point at time `t` on a cubic curve.
 
@@ -1068,19 +1283,15 @@ def cubicPointAtT(pt1, pt2, pt3, pt4, t):
     Returns:
         A 2D tuple with the coordinates of the point.
     """
+    x1, y1 = pt1
+    x2, y2 = pt2
+    x3, y3 = pt3
+    x4, y4 = pt4
     t2 = t * t
     _1_t = 1 - t
     _1_t_2 = _1_t * _1_t
-    x = (
-        _1_t_2 * _1_t * pt1[0]
-        + 3 * (_1_t_2 * t * pt2[0] + _1_t * t2 * pt3[0])
-        + t2 * t * pt4[0]
-    )
-    y = (
-        _1_t_2 * _1_t * pt1[1]
-        + 3 * (_1_t_2 * t * pt2[1] + _1_t * t2 * pt3[1])
-        + t2 * t * pt4[1]
-    )
+    x = _1_t_2 * _1_t * x1 + 3 * (_1_t_2 * t * x2 + _1_t * t2 * x3) + t2 * t * x4
+    y = _1_t_2 * _1_t * y1 + 3 * (_1_t_2 * t * y2 + _1_t * t2 * y3) + t2 * t * y4
     return (x, y)
 
 
@@ -1171,38 +1382,33 @@ def lineLineIntersections(s1, e1, s2, e2):
     e1x, e1y = e1
     s2x, s2y = s2
     e2x, e2y = e2
-    if (
-        math.isclose(s2x, e2x) and math.isclose(s1x, e1x) and not math.isclose(s1x, s2x)
-    ):  # Parallel vertical
+    # Each of these is needed by several of the tests below.
+    vertical1 = math.isclose(s1x, e1x)
+    horizontal1 = math.isclose(s1y, e1y)
+    vertical2 = math.isclose(s2x, e2x)
+    horizontal2 = math.isclose(s2y, e2y)
+    if vertical2 and vertical1 and not math.isclose(s1x, s2x):  # Parallel vertical
         return []
     if (
-        math.isclose(s2y, e2y) and math.isclose(s1y, e1y) and not math.isclose(s1y, s2y)
+        horizontal2 and horizontal1 and not math.isclose(s1y, s2y)
     ):  # Parallel horizontal
         return []
-    if math.isclose(s2x, e2x) and math.isclose(s2y, e2y):  # Line segment is tiny
+    if vertical2 and horizontal2:  # Line segment is tiny
         return []
-    if math.isclose(s1x, e1x) and math.isclose(s1y, e1y):  # Line segment is tiny
+    if vertical1 and horizontal1:  # Line segment is tiny
         return []
-    if math.isclose(e1x, s1x):
+    if vertical1:
         x = s1x
         slope34 = (e2y - s2y) / (e2x - s2x)
         y = slope34 * (x - s2x) + s2y
         pt = (x, y)
-        return [
-            Intersection(
-                pt=pt, t1=_line_t_of_pt(s1, e1, pt), t2=_line_t_of_pt(s2, e2, pt)
-            )
-        ]
-    if math.isclose(s2x, e2x):
+        return [Intersection(pt, _line_t_of_pt(s1, e1, pt), _line_t_of_pt(s2, e2, pt))]
+    if vertical2:
         x = s2x
         slope12 = (e1y - s1y) / (e1x - s1x)
         y = slope12 * (x - s1x) + s1y
         pt = (x, y)
-        return [
-            Intersection(
-                pt=pt, t1=_line_t_of_pt(s1, e1, pt), t2=_line_t_of_pt(s2, e2, pt)
-            )
-        ]
+        return [Intersection(pt, _line_t_of_pt(s1, e1, pt), _line_t_of_pt(s2, e2, pt))]
 
     slope12 = (e1y - s1y) / (e1x - s1x)
     slope34 = (e2y - s2y) / (e2x - s2x)
@@ -1214,35 +1420,51 @@ def lineLineIntersections(s1, e1, s2, e2):
     if _both_points_are_on_same_side_of_origin(
         pt, e1, s1
     ) and _both_points_are_on_same_side_of_origin(pt, s2, e2):
-        return [
-            Intersection(
-                pt=pt, t1=_line_t_of_pt(s1, e1, pt), t2=_line_t_of_pt(s2, e2, pt)
-            )
-        ]
+        return [Intersection(pt, _line_t_of_pt(s1, e1, pt), _line_t_of_pt(s2, e2, pt))]
     return []
 
 
 def _alignment_transformation(segment):
     # Returns a transformation which aligns a segment horizontally at the
-    # origin. Apply this transformation to curves and root-find to find
-    # intersections with the segment.
+    # origin. Apply this transformation to curves with _align_points() and
+    # root-find to find intersections with the segment.
+    #
+    # This is Identity.rotate(-angle).translate(-x, -y) composed by hand, as
+    # an (xx, xy, yx, yy, dx, dy) tuple. It performs the same operations as
+    # Transform, in the same order, so the aligned points and in turn the
+    # intersections and _is_linelike() come out bit-identical; it only skips
+    # building the intermediate Transforms.
     start = segment[0]
     end = segment[-1]
     angle = math.atan2(end[1] - start[1], end[0] - start[0])
-    return Identity.rotate(-angle).translate(-start[0], -start[1])
+    c = _normSinCos(math.cos(-angle))
+    s = _normSinCos(math.sin(-angle))
+    tx = -start[0]
+    ty = -start[1]
+    # The "+ 0" is the rotation's zero offset; like in Transform, it turns
+    # a -0.0 offset into 0.0.
+    return (c, s, -s, c, c * tx + -s * ty + 0, s * tx + c * ty + 0)
+
+
+def _align_points(transformation, points):
+    # Same as Transform.transformPoints().
+    xx, xy, yx, yy, dx, dy = transformation
+    return [(xx * x + yx * y + dx, xy * x + yy * y + dy) for x, y in points]
 
 
 def _curve_line_intersections_t(curve, line):
-    aligned_curve = _alignment_transformation(line).transformPoints(curve)
+    aligned_curve = _align_points(_alignment_transformation(line), curve)
     if len(curve) == 3:
         a, b, c = calcQuadraticParameters(*aligned_curve)
-        intersections = solveQuadratic(a[1], b[1], c[1])
+        intersections = _solveQuadratic(a[1], b[1], c[1])
     elif len(curve) == 4:
         a, b, c, d = calcCubicParameters(*aligned_curve)
         intersections = solveCubic(a[1], b[1], c[1], d[1])
     else:
         raise ValueError("Unknown curve degree")
-    return sorted(i for i in intersections if 0.0 <= i <= 1)
+    intersections = [i for i in intersections if 0.0 <= i <= 1]
+    intersections.sort()
+    return intersections
 
 
 def curveLineIntersections(curve, line):
@@ -1279,7 +1501,7 @@ def curveLineIntersections(curve, line):
         # numerical accuracy in the case of vertical and horizontal lines
         line_t = _line_t_of_pt(*line, pt)
         pt = linePointAtT(*line, line_t)
-        intersections.append(Intersection(pt=pt, t1=t, t2=line_t))
+        intersections.append(Intersection(pt, t, line_t))
     return intersections
 
 
@@ -1291,87 +1513,301 @@ def _curve_bounds(c):
     raise ValueError("Unknown curve degree")
 
 
-def _split_segment_at_t(c, t):
-    if len(c) == 2:
-        s, e = c
-        midpoint = linePointAtT(s, e, t)
-        return [(s, midpoint), (midpoint, e)]
-    if len(c) == 3:
-        return splitQuadraticAtT(*c, t)
-    elif len(c) == 4:
-        return splitCubicAtT(*c, t)
+# Intersection sweeps test the same curves of an outline against each other
+# over and over, and most pairs can be rejected on their bounds alone.
+@lru_cache(maxsize=1024)
+def _cached_curve_bounds(c):
+    return _curve_bounds(c)
+
+
+@cython.cfunc
+@cython.locals(
+    p0=cython.complex,
+    p1=cython.complex,
+    p2=cython.complex,
+    p3=cython.complex,
+    a=cython.complex,
+    b=cython.complex,
+    c=cython.complex,
+    pt=cython.complex,
+    t=cython.double,
+    xMin=cython.double,
+    yMin=cython.double,
+    xMax=cython.double,
+    yMax=cython.double,
+)
+def _curve_bounds_c(curve):
+    # Like _curve_bounds, for control points given as complex numbers.
+    if len(curve) == 3:
+        p0, p1, p2 = curve
+        b = (p1 - p0) * 2.0
+        a = p2 - p0 - b
+        xMin, xMax = min(p0.real, p2.real), max(p0.real, p2.real)
+        yMin, yMax = min(p0.imag, p2.imag), max(p0.imag, p2.imag)
+        if a.real != 0:
+            t = -b.real / (2.0 * a.real)
+            if 0 <= t < 1:
+                pt = (a * t + b) * t + p0
+                xMin, xMax = min(xMin, pt.real), max(xMax, pt.real)
+                yMin, yMax = min(yMin, pt.imag), max(yMax, pt.imag)
+        if a.imag != 0:
+            t = -b.imag / (2.0 * a.imag)
+            if 0 <= t < 1:
+                pt = (a * t + b) * t + p0
+                xMin, xMax = min(xMin, pt.real), max(xMax, pt.real)
+                yMin, yMax = min(yMin, pt.imag), max(yMax, pt.imag)
+    elif len(curve) == 4:
+        p0, p1, p2, p3 = curve
+        c = (p1 - p0) * 3.0
+        b = (p2 - p1) * 3.0 - c
+        a = p3 - p0 - c - b
+        xMin, xMax = min(p0.real, p3.real), max(p0.real, p3.real)
+        yMin, yMax = min(p0.imag, p3.imag), max(p0.imag, p3.imag)
+        for t in _solveQuadratic(a.real * 3.0, b.real * 2.0, c.real) + _solveQuadratic(
+            a.imag * 3.0, b.imag * 2.0, c.imag
+        ):
+            if 0 <= t < 1:
+                pt = ((a * t + b) * t + c) * t + p0
+                xMin, xMax = min(xMin, pt.real), max(xMax, pt.real)
+                yMin, yMax = min(yMin, pt.imag), max(yMax, pt.imag)
+    else:
+        raise ValueError("Unknown curve degree")
+    return xMin, yMin, xMax, yMax
+
+
+@cython.cfunc
+@cython.locals(
+    p0=cython.complex,
+    p1=cython.complex,
+    p2=cython.complex,
+    p3=cython.complex,
+    m01=cython.complex,
+    m12=cython.complex,
+    m23=cython.complex,
+    m012=cython.complex,
+    m123=cython.complex,
+    mid=cython.complex,
+)
+def _split_curve_at_half_c(curve):
+    # de Casteljau at t=0.5, for control points given as complex numbers.
+    if len(curve) == 3:
+        p0, p1, p2 = curve
+        m01 = (p0 + p1) * 0.5
+        m12 = (p1 + p2) * 0.5
+        mid = (m01 + m12) * 0.5
+        return (p0, m01, mid), (mid, m12, p2)
+    elif len(curve) == 4:
+        p0, p1, p2, p3 = curve
+        m01 = (p0 + p1) * 0.5
+        m12 = (p1 + p2) * 0.5
+        m23 = (p2 + p3) * 0.5
+        m012 = (m01 + m12) * 0.5
+        m123 = (m12 + m23) * 0.5
+        mid = (m012 + m123) * 0.5
+        return (p0, m01, m012, mid), (mid, m123, m23, p3)
     raise ValueError("Unknown curve degree")
 
 
+@cython.locals(
+    precision=cython.double,
+    precision_inv=cython.double,
+    t1=cython.double,
+    t2=cython.double,
+    mid=cython.double,
+    xMin1=cython.double,
+    yMin1=cython.double,
+    xMax1=cython.double,
+    yMax1=cython.double,
+    xMin2=cython.double,
+    yMin2=cython.double,
+    xMax2=cython.double,
+    yMax2=cython.double,
+    area1=cython.double,
+    area2=cython.double,
+)
 def _curve_curve_intersections_t(
     curve1, curve2, precision=1e-3, range1=None, range2=None
 ):
-    bounds1 = _curve_bounds(curve1)
-    bounds2 = _curve_bounds(curve2)
-
     if not range1:
         range1 = (0.0, 1.0)
     if not range2:
         range2 = (0.0, 1.0)
 
-    # If bounds don't intersect, go home
-    intersects, _ = sectRect(bounds1, bounds2)
-    if not intersects:
-        return []
+    # Intersections that fall in the same precision-sized cell are
+    # duplicates; keep the first one found.
+    precision_inv = 1.0 / precision
+    unique_values = {}
+
+    # Points are handled as complex numbers during the subdivision, which
+    # makes the arithmetic on them much cheaper than on tuples.
+    curve1 = tuple(complex(*pt) for pt in curve1)
+    curve2 = tuple(complex(*pt) for pt in curve2)
+
+    # Subdivide with an explicit stack instead of recursing. Children are
+    # pushed in reverse so they are popped in the same depth-first order
+    # the recursive formulation visited them in. Each entry carries the
+    # bounds of its curves, so every half is only measured once even though
+    # it is paired with both halves of the other curve.
+    stack = [
+        (
+            curve1,
+            _curve_bounds_c(curve1),
+            range1,
+            curve2,
+            _curve_bounds_c(curve2),
+            range2,
+        )
+    ]
+    while stack:
+        curve1, bounds1, range1, curve2, bounds2, range2 = stack.pop()
+
+        # If bounds don't intersect, go home. This is sectRect's test, without
+        # building the intersection rectangle.
+        xMin1, yMin1, xMax1, yMax1 = bounds1
+        xMin2, yMin2, xMax2, yMax2 = bounds2
+        if max(xMin1, xMin2) >= min(xMax1, xMax2) or max(yMin1, yMin2) >= min(
+            yMax1, yMax2
+        ):
+            continue
+
+        # If they do overlap but they're tiny, approximate
+        area1 = (yMax1 - yMin1) * (xMax1 - xMin1)
+        area2 = (yMax2 - yMin2) * (xMax2 - xMin2)
+        if area1 < precision and area2 < precision:
+            t1 = 0.5 * (range1[0] + range1[1])
+            t2 = 0.5 * (range2[0] + range2[1])
+            unique_values.setdefault(
+                (int(t1 * precision_inv), int(t2 * precision_inv)), (t1, t2)
+            )
+            continue
+
+        # Only split the larger of the two curves; the smaller one is carried
+        # over unchanged, along with its bounds.
+        if area1 >= area2:
+            c11, c12 = _split_curve_at_half_c(curve1)
+            mid = 0.5 * (range1[0] + range1[1])
+            c11_range = (range1[0], mid)
+            c12_range = (mid, range1[1])
+            stack.append(
+                (c12, _curve_bounds_c(c12), c12_range, curve2, bounds2, range2)
+            )
+            stack.append(
+                (c11, _curve_bounds_c(c11), c11_range, curve2, bounds2, range2)
+            )
+        else:
+            c21, c22 = _split_curve_at_half_c(curve2)
+            mid = 0.5 * (range2[0] + range2[1])
+            c21_range = (range2[0], mid)
+            c22_range = (mid, range2[1])
+            stack.append(
+                (curve1, bounds1, range1, c22, _curve_bounds_c(c22), c22_range)
+            )
+            stack.append(
+                (curve1, bounds1, range1, c21, _curve_bounds_c(c21), c21_range)
+            )
+
+    return list(unique_values.values())
+
 
-    def midpoint(r):
-        return 0.5 * (r[0] + r[1])
+def _split_curves_at_half_np(np, curves):
+    # de Casteljau at t=0.5 on an array of shape (K, degree+1, 2).
+    left = [curves[:, 0]]
+    right = [curves[:, -1]]
+    while curves.shape[1] > 1:
+        curves = (curves[:, :-1] + curves[:, 1:]) * 0.5
+        left.append(curves[:, 0])
+        right.append(curves[:, -1])
+    return np.stack(left, axis=1), np.stack(right[::-1], axis=1)
 
-    # If they do overlap but they're tiny, approximate
-    if rectArea(bounds1) < precision and rectArea(bounds2) < precision:
-        return [(midpoint(range1), midpoint(range2))]
 
-    c11, c12 = _split_segment_at_t(curve1, 0.5)
-    c11_range = (range1[0], midpoint(range1))
-    c12_range = (midpoint(range1), range1[1])
+def _curve_curve_intersections_t_batch(curves1, curves2, precision=1e-3):
+    # Vectorized variant of _curve_curve_intersections_t: the whole
+    # subdivision frontier of all curve pairs is processed one level at a
+    # time. Boxes are the control point hulls rather than the exact bounds,
+    # which are cheaper to compute on arrays and just as valid for pruning.
+    import numpy as np
 
-    c21, c22 = _split_segment_at_t(curve2, 0.5)
-    c21_range = (range2[0], midpoint(range2))
-    c22_range = (midpoint(range2), range2[1])
+    curves1 = np.asarray(curves1, dtype=float)
+    curves2 = np.asarray(curves2, dtype=float)
+    count = len(curves1)
+    ranges1 = np.tile([0.0, 1.0], (count, 1))
+    ranges2 = np.tile([0.0, 1.0], (count, 1))
+    index = np.arange(count)
 
     found = []
-    found.extend(
-        _curve_curve_intersections_t(
-            c11, c21, precision, range1=c11_range, range2=c21_range
-        )
-    )
-    found.extend(
-        _curve_curve_intersections_t(
-            c12, c21, precision, range1=c12_range, range2=c21_range
+    while len(index):
+        min1 = curves1.min(axis=1)
+        max1 = curves1.max(axis=1)
+        min2 = curves2.min(axis=1)
+        max2 = curves2.max(axis=1)
+
+        # Same test as sectRect
+        intersects = np.all(np.maximum(min1, min2) < np.minimum(max1, max2), axis=1)
+        area1 = np.prod(max1 - min1, axis=1)
+        area2 = np.prod(max2 - min2, axis=1)
+
+        tiny = intersects & (area1 < precision) & (area2 < precision)
+        if tiny.any():
+            found.append(
+                np.column_stack(
+                    (
+                        index[tiny],
+                        ranges1[tiny].mean(axis=1),
+                        ranges2[tiny].mean(axis=1),
+                    )
+                )
+            )
+
+        # Only split the larger of the two curves, as the scalar version does
+        alive = intersects & ~tiny
+        split1 = alive & (area1 >= area2)
+        split2 = alive & (area1 < area2)
+
+        l1, r1 = _split_curves_at_half_np(np, curves1[split1])
+        mid1 = ranges1[split1].mean(axis=1)
+        l2, r2 = _split_curves_at_half_np(np, curves2[split2])
+        mid2 = ranges2[split2].mean(axis=1)
+
+        curves1 = np.concatenate((l1, r1, curves1[split2], curves1[split2]))
+        curves2 = np.concatenate((curves2[split1], curves2[split1], l2, r2))
+        ranges1 = np.concatenate(
+            (
+                np.column_stack((ranges1[split1][:, 0], mid1)),
+                np.column_stack((mid1, ranges1[split1][:, 1])),
+                ranges1[split2],
+                ranges1[split2],
+            )
         )
-    )
-    found.extend(
-        _curve_curve_intersections_t(
-            c11, c22, precision, range1=c11_range, range2=c22_range
+        ranges2 = np.concatenate(
+            (
+                ranges2[split1],
+                ranges2[split1],
+                np.column_stack((ranges2[split2][:, 0], mid2)),
+                np.column_stack((mid2, ranges2[split2][:, 1])),
+            )
         )
-    )
-    found.extend(
-        _curve_curve_intersections_t(
-            c12, c22, precision, range1=c12_range, range2=c22_range
+        index = np.concatenate(
+            (index[split1], index[split1], index[split2], index[split2])
         )
-    )
 
-    unique_key = lambda ts: (int(ts[0] / precision), int(ts[1] / precision))
-    seen = set()
-    unique_values = []
-
-    for ts in found:
-        key = unique_key(ts)
-        if key in seen:
-            continue
-        seen.add(key)
-        unique_values.append(ts)
-
-    return unique_values
+    results = [[] for _ in range(count)]
+    if not found:
+        return results
+    found = np.concatenate(found)
+    found = found[np.lexsort((found[:, 2], found[:, 1], found[:, 0]))]
+    precision_inv = 1.0 / precision
+    unique_values = {}
+    for i, t1, t2 in found.tolist():
+        unique_values.setdefault(
+            (int(i), int(t1 * precision_inv), int(t2 * precision_inv)), (t1, t2)
+        )
+    for (i, _, _), ts in unique_values.items():
+        results[i].append(ts)
+    return results
 
 
 def _is_linelike(segment):
-    maybeline = _alignment_transformation(segment).transformPoints(segment)
+    maybeline = _align_points(_alignment_transformation(segment), segment)
     return all(math.isclose(p[1], 0.0) for p in maybeline)
 
 
@@ -1407,13 +1843,82 @@ def curveCurveIntersections(curve1, curve2):
         line2 = curve2[0], curve2[-1]
         return curveLineIntersections(curve1, line2)
 
+    bounds1 = _cached_curve_bounds(tuple(tuple(pt) for pt in curve1))
+    bounds2 = _cached_curve_bounds(tuple(tuple(pt) for pt in curve2))
+    intersects, _ = sectRect(bounds1, bounds2)
+    if not intersects:
+        return []
+
     intersection_ts = _curve_curve_intersections_t(curve1, curve2)
     return [
-        Intersection(pt=segmentPointAtT(curve1, ts[0]), t1=ts[0], t2=ts[1])
+        Intersection(segmentPointAtT(curve1, ts[0]), ts[0], ts[1])
         for ts in intersection_ts
     ]
 
 
+def curveCurveIntersectionsBatch(curves1, curves2):
+    """Finds intersections between many pairs of curves at once.
+
+    This is the vectorized equivalent of calling :func:`curveCurveIntersections`
+    on each pair, and requires NumPy. All pairs that need subdividing are
+    processed together, which pays off when intersecting many segments, for
+    example all segments of one outline against those of another.
+
+    Args:
+        curves1: A sequence of first curve segments, each a list of 2D tuples.
+        curves2: A sequence of second curve segments, of the same length as
+            ``curves1``.
+
+    Returns:
+        A list with, for each pair of curves, a list of ``Intersection``
+        objects sorted by ``t1``. Intersections agree with those of
+        :func:`curveCurveIntersections` to within its precision, and have the
+        same meaning: if only ``curve1`` is line-like, ``t1`` is the time on
+        ``curve2`` and ``t2`` the time on the line through the end points of
+        ``curve1``.
+    """
+    if len(curves1) != len(curves2):
+        raise ValueError("curves1 and curves2 must have the same length")
+
+    results = [None] * len(curves1)
+    groups = {}
+    for i, (curve1, curve2) in enumerate(zip(curves1, curves2)):
+        # Line-like curves are handled as in curveCurveIntersections
+        if _is_linelike(curve1):
+            line1 = curve1[0], curve1[-1]
+            if _is_linelike(curve2):
+                line2 = curve2[0], curve2[-1]
+                results[i] = lineLineIntersections(*line1, *line2)
+            else:
+                results[i] = curveLineIntersections(curve2, line1)
+            continue
+        if _is_linelike(curve2):
+            line2 = curve2[0], curve2[-1]
+            results[i] = curveLineIntersections(curve1, line2)
+            continue
+        bounds1 = _cached_curve_bounds(tuple(tuple(pt) for pt in curve1))
+        bounds2 = _cached_curve_bounds(tuple(tuple(pt) for pt in curve2))
+        intersects, _ = sectRect(bounds1, bounds2)
+        if not intersects:
+            results[i] = []
+            continue
+        # The kernel needs arrays of uniform shape, so group by degrees
+        groups.setdefault((len(curve1), len(curve2)), []).append(i)
+
+    for indices in groups.values():
+        group1 = [curves1[i] for i in indices]
+        found = _curve_curve_intersections_t_batch(
+            group1, [curves2[i] for i in indices]
+        )
+        for i, curve1, intersection_ts in zip(indices, group1, found):
+            results[i] = [
+                Intersection(segmentPointAtT(curve1, t1), t1, t2)
+                for t1, t2 in intersection_ts
+            ]
+
+    return results
+
+
 def segmentSegmentIntersections(seg1, seg2):
     """Finds intersections between two segments.
 
@@ -1459,7 +1964,7 @@ def segmentSegmentIntersections(seg1, seg2):
         raise ValueError("Couldn't work out which intersection function to use")
     if not swapped:
         return intersections
-    return [Intersection(pt=i.pt, t1=i.t2, t2=i.t1) for i in intersections]
+    return [Intersection(i.pt, i.t2, i.t1) for i in intersections]
 
 
 def _segmentrepr(obj):
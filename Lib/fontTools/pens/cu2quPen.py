@@ -12,8 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
 import operator
+import struct
 from fontTools.cu2qu import curve_to_quadratic, curves_to_quadratic
+from fontTools.cu2qu.cu2qu import MAX_N
 from fontTools.pens.basePen import decomposeSuperBezierSegment
 from fontTools.pens.filterPen import FilterPen
 from fontTools.pens.reverseContourPen import ReverseContourPen
@@ -21,6 +26,30 @@ from fontTools.pens.pointPen import BasePointToSegmentPen
 from fontTools.pens.pointPen import ReverseContourPointPen
 
 
+# Fonts reuse identical cubic segments a lot (decomposed components,
+# symmetric shapes, glyphs drawn more than once), so remember recent
+# conversions. The returned lists must not be mutated.
+#
+# The key is the control points packed as doubles, not the points
+# themselves: 0.0 == -0.0, but the conversion keeps the sign of a zero.
+_curve_struct = struct.Struct("8d")
+
+
+@lru_cache(maxsize=4096)
+def _cached_curve_to_quadratic(packed_curve, max_err, all_quadratic):
+    x0, y0, x1, y1, x2, y2, x3, y3 = _curve_struct.unpack(packed_curve)
+    curve = ((x0, y0), (x1, y1), (x2, y2), (x3, y3))
+    return curve_to_quadratic(curve, max_err, all_quadratic)
+
+
+# The stats dictionaries are keyed by the number of off-curve points as a
+# string; format those once rather than for every converted curve.
+_STATS_KEYS = tuple(str(n) for n in range(MAX_N + 1))
+
+# Shared, read-only kwargs for the off-curve points we generate ourselves.
+_NO_KWARGS = MappingProxyType({})
+
+
 class Cu2QuPen(FilterPen):
     """A filter pen to convert cubic bezier curves to quadratic b-splines
     using the FontTools SegmentPen protocol.
@@ -54,12 +83,14 @@ class Cu2QuPen(FilterPen):
         self.all_quadratic = all_quadratic
 
     def _convert_curve(self, pt1, pt2, pt3):
-        curve = (self.current_pt, pt1, pt2, pt3)
-        result = curve_to_quadratic(curve, self.max_err, self.all_quadratic)
-        if self.stats is not None:
-            n = str(len(result) - 2)
-            self.stats[n] = self.stats.get(n, 0) + 1
-        if self.all_quadratic:
+        all_quadratic = self.all_quadratic
+        packed_curve = _curve_struct.pack(*self.current_pt, *pt1, *pt2, *pt3)
+        result = _cached_curve_to_quadratic(packed_curve, self.max_err, all_quadratic)
+        stats = self.stats
+        if stats is not None:
+            n = _STATS_KEYS[len(result) - 2]
+            stats[n] = stats.get(n, 0) + 1
+        if all_quadratic:
             self.qCurveTo(*result[1:])
         else:
             if len(result) == 3:
@@ -74,8 +105,9 @@ class Cu2QuPen(FilterPen):
             # this is the most common case, so we special-case it
             self._convert_curve(*points)
         elif n > 3:
+            convert_curve = self._convert_curve
             for segment in decomposeSuperBezierSegment(points):
-                self._convert_curve(*segment)
+                convert_curve(*segment)
         else:
             self.qCurveTo(*points)
 
@@ -123,26 +155,33 @@ class Cu2QuPointPen(BasePointToSegmentPen):
     def _flushContour(self, segments):
         assert len(segments) >= 1
         closed = segments[0][0] != "move"
-        new_segments = []
+        new_segments = deque()
         prev_points = segments[-1][1]
         prev_on_curve = prev_points[-1][0]
+        max_err = self.max_err
+        all_quadratic = self.all_quadratic
+        stats = self.stats
         for segment_type, points in segments:
             if segment_type == "curve":
                 for sub_points in self._split_super_bezier_segments(points):
                     on_curve, smooth, name, kwargs = sub_points[-1]
                     bcp1, bcp2 = sub_points[0][0], sub_points[1][0]
-                    cubic = [prev_on_curve, bcp1, bcp2, on_curve]
-                    quad = curve_to_quadratic(cubic, self.max_err, self.all_quadratic)
-                    if self.stats is not None:
-                        n = str(len(quad) - 2)
-                        self.stats[n] = self.stats.get(n, 0) + 1
-                    new_points = [(pt, False, None, {}) for pt in quad[1:-1]]
+                    packed_cubic = _curve_struct.pack(
+                        *prev_on_curve, *bcp1, *bcp2, *on_curve
+                    )
+                    quad = _cached_curve_to_quadratic(
+                        packed_cubic, max_err, all_quadratic
+                    )
+                    if stats is not None:
+                        n = _STATS_KEYS[len(quad) - 2]
+                        stats[n] = stats.get(n, 0) + 1
+                    new_points = [(pt, False, None, _NO_KWARGS) for pt in quad[1:-1]]
                     new_points.append((on_curve, smooth, name, kwargs))
-                    if self.all_quadratic or len(new_points) == 2:
+                    if all_quadratic or len(new_points) == 2:
                         new_segments.append(["qcurve", new_points])
                     else:
                         new_segments.append(["curve", new_points])
-                    prev_on_curve = sub_points[-1][0]
+                    prev_on_curve = on_curve
             else:
                 new_segments.append([segment_type, points])
                 prev_on_curve = points[-1][0]
@@ -150,7 +189,7 @@ class Cu2QuPointPen(BasePointToSegmentPen):
             # the BasePointToSegmentPen.endPath method that calls _flushContour
             # rotates the point list of closed contours so that they end with
             # the first on-curve point. We restore the original starting point.
-            new_segments = new_segments[-1:] + new_segments[:-1]
+            new_segments.rotate(1)
         self._drawPoints(new_segments)
 
     def _split_super_bezier_segments(self, points):
@@ -169,13 +208,13 @@ class Cu2QuPointPen(BasePointToSegmentPen):
             ):
                 new_segment = []
                 for point in sub_points[:-1]:
-                    new_segment.append((point, False, None, {}))
+                    new_segment.append((point, False, None, _NO_KWARGS))
                 if i == (num_sub_segments - 1):
                     # the last on-curve keeps its original attributes
                     new_segment.append((on_curve, smooth, name, kwargs))
                 else:
                     # on-curves of sub-segments are always "smooth"
-                    new_segment.append((sub_points[-1], True, None, {}))
+                    new_segment.append((sub_points[-1], True, None, _NO_KWARGS))
                 sub_segments.append(new_segment)
         else:
             raise AssertionError("expected 2 control points, found: %d" % n)
@@ -272,17 +311,21 @@ class Cu2QuMultiPen:
         self.start_pts = self.current_pts = pts
         self._add_moveTo()
 
-    def lineTo(self, pts):
-        self._check_contour_is_open()
+    def _emit_line(self, pts):
+        # the caller has already checked that the contour is open
         self._add_moveTo()
         for pt, pen in zip(pts, self.pens):
             pen.lineTo(*pt)
         self.current_pts = pts
 
+    def lineTo(self, pts):
+        self._check_contour_is_open()
+        self._emit_line(pts)
+
     def qCurveTo(self, pointsList):
         self._check_contour_is_open()
         if len(pointsList[0]) == 1:
-            self.lineTo([(points[0],) for points in pointsList])
+            self._emit_line([(points[0],) for points in pointsList])
             return
         self._add_moveTo()
         current_pts = []
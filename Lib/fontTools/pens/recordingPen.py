@@ -312,6 +312,20 @@ def lerpRecordings(recording1, recording2, factor=0.5):
             raise ValueError("Mismatched operations: %s, %s" % (op1, op2))
         if op1 == "addComponent":
             raise ValueError("Cannot interpolate components")
+        n = len(args1)
+        # Unroll the common lineTo/moveTo and curveTo shapes
+        if n == 1 and len(args2) == 1:
+            ((x1, y1),) = args1
+            ((x2, y2),) = args2
+            mid_args = [(x1 + (x2 - x1) * factor, y1 + (y2 - y1) * factor)]
+        elif n == 3 and len(args2) == 3:
+            (x1, y1), (x3, y3), (x5, y5) = args1
+            (x2, y2), (x4, y4), (x6, y6) = args2
+            mid_args = [
+                (x1 + (x2 - x1) * factor, y1 + (y2 - y1) * factor),
+                (x3 + (x4 - x3) * factor, y3 + (y4 - y3) * factor),
+                (x5 + (x6 - x5) * factor, y5 + (y6 - y5) * factor),
+            ]
         else:
             mid_args = [
                 (x1 + (x2 - x1) * factor, y1 + (y2 - y1) * factor)
@@ -21,6 +21,7 @@ class TransformPen(FilterPen):
             transformation = Transform(*transformation)
         self._transformation = transformation
         self._transformPoint = transformation.transformPoint
+        self._transformPointList = getattr(transformation, "transformPoints", None)
         self._stack = []
 
     def moveTo(self, pt):
@@ -40,8 +41,11 @@ class TransformPen(FilterPen):
         self._outPen.qCurveTo(*points)
 
     def _transformPoints(self, points):
-        transformPoint = self._transformPoint
-        return [transformPoint(pt) for pt in points]
+        # Transforming a whole list at once only pays off for longer runs,
+        # such as the off-curve points of a TrueType contour.
+        if len(points) < 4 or self._transformPointList is None:
+            return list(map(self._transformPoint, points))
+        return self._transformPointList(points)
 
     def closePath(self):
         self._outPen.closePath()
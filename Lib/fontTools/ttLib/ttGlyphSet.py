@@ -363,13 +363,19 @@ class LerpGlyph:
     def __init__(self, glyphname, glyphset):
         self.glyphset = glyphset
         self.glyphname = glyphname
+        self._recordings = None
 
     def draw(self, pen):
-        recording1 = DecomposingRecordingPen(self.glyphset.glyphset1)
-        self.glyphset.glyphset1[self.glyphname].draw(recording1)
-        recording2 = DecomposingRecordingPen(self.glyphset.glyphset2)
-        self.glyphset.glyphset2[self.glyphname].draw(recording2)
+        # Callers commonly draw the same glyph more than once, e.g. both
+        # plain and decomposed; record the two source glyphs only once.
+        recordings = self._recordings
+        if recordings is None:
+            recording1 = DecomposingRecordingPen(self.glyphset.glyphset1)
+            self.glyphset.glyphset1[self.glyphname].draw(recording1)
+            recording2 = DecomposingRecordingPen(self.glyphset.glyphset2)
+            self.glyphset.glyphset2[self.glyphname].draw(recording2)
+            recordings = self._recordings = (recording1.value, recording2.value)
 
         factor = self.glyphset.factor
 
-        replayRecording(lerpRecordings(recording1.value, recording2.value, factor), pen)
+        replayRecording(lerpRecordings(*recordings, factor), pen)
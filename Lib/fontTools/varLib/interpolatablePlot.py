@@ -1,12 +1,12 @@
 from .interpolatableHelpers import *
 from fontTools.ttLib import TTFont
+from fontTools.misc.arrayTools import calcBounds
 from fontTools.ttLib.ttGlyphSet import LerpGlyphSet
 from fontTools.pens.recordingPen import (
     RecordingPen,
     DecomposingRecordingPen,
     RecordingPointPen,
 )
-from fontTools.pens.boundsPen import ControlBoundsPen
 from fontTools.pens.cairoPen import CairoPen
 from fontTools.pens.pointPen import (
     SegmentToPointPen,
@@ -116,6 +116,12 @@ class InterpolatablePlot:
         self.glyphsets = glyphsets
         self.names = names or [repr(g) for g in glyphsets]
         self.toc = {}
+        self._recordings_glyphname = None
+        self._recordings = {}
+        self._label_fonts = {}
+        self._text_metrics = {}
+        self._patterns = {}
+        self._sample_glyphs = {}
 
         for k, v in kwargs.items():
             if not hasattr(self, k):
@@ -126,6 +132,9 @@ class InterpolatablePlot:
         self.panel_height = (
             self.height / 2 - self.pad * 6 - self.font_size * 2 - self.title_font_size
         )
+        self._contour_patterns = tuple(
+            self._pattern((*color, self.contour_alpha)) for color in self.contour_colors
+        )
 
     def __enter__(self):
         return self
@@ -136,6 +145,15 @@ class InterpolatablePlot:
     def show_page(self):
         self.page_number += 1
 
+    def _pattern(self, color):
+        # Solid patterns are immutable, so one per color is shared by all
+        # the drawing calls that use it.
+        color = tuple(color)
+        pattern = self._patterns.get(color)
+        if pattern is None:
+            pattern = self._patterns[color] = cairo.SolidPattern(*color)
+        return pattern
+
     def add_title_page(
         self, files, *, show_tolerance=True, tolerance=None, kinkiness=None
     ):
@@ -476,9 +494,11 @@ class InterpolatablePlot:
         master_indices = [problems[0][k] for k in master_keys]
 
         if problem_type == InterpolatableProblem.MISSING:
-            sample_glyph = next(
-                i for i, m in enumerate(self.glyphsets) if m[glyphname] is not None
-            )
+            sample_glyph = self._sample_glyphs.get(glyphname)
+            if sample_glyph is None:
+                sample_glyph = self._sample_glyphs[glyphname] = next(
+                    i for i, m in enumerate(self.glyphsets) if m[glyphname] is not None
+                )
             master_indices.insert(0, sample_glyph)
 
         x = self.pad
@@ -816,11 +836,19 @@ class InterpolatablePlot:
             cairo.FONT_SLANT_NORMAL,
             cairo.FONT_WEIGHT_BOLD if bold else cairo.FONT_WEIGHT_NORMAL,
         )
-        cr.set_font_size(font_size)
-        font_extents = cr.font_extents()
-        font_size = font_size * font_size / font_extents[2]
-        cr.set_font_size(font_size)
-        font_extents = cr.font_extents()
+        # The font size correction and ascent only depend on the font, not on
+        # the label, so measure them once per font.
+        key = (bold, font_size)
+        calibrated = self._label_fonts.get(key)
+        if calibrated is None:
+            cr.set_font_size(font_size)
+            font_extents = cr.font_extents()
+            font_size = font_size * font_size / font_extents[2]
+            cr.set_font_size(font_size)
+            calibrated = self._label_fonts[key] = (font_size, cr.font_extents()[0])
+        else:
+            cr.set_font_size(calibrated[0])
+        font_size, ascent = calibrated
 
         cr.set_source_rgb(*color)
 
@@ -829,15 +857,55 @@ class InterpolatablePlot:
             # Shrink
             font_size *= width / extents.width
             cr.set_font_size(font_size)
-            font_extents = cr.font_extents()
+            ascent = cr.font_extents()[0]
             extents = cr.text_extents(label)
 
         # Center
         label_x = x + (width - extents.width) * align
-        label_y = y + font_extents[0]
+        label_y = y + ascent
         cr.move_to(label_x, label_y)
         cr.show_text(label)
 
+    def _record_glyph(self, glyphset, glyphname):
+        # A master's glyph is drawn again on every page listing one of its
+        # problems, so record and measure it only once. Only glyphs of the
+        # current glyph name are kept, and only for the masters themselves;
+        # other glyphsets, like the midway ones, are built anew for every page.
+        if glyphname != self._recordings_glyphname:
+            self._recordings_glyphname = glyphname
+            self._recordings = {}
+        cacheable = any(g is glyphset for g in self.glyphsets)
+        if cacheable and id(glyphset) in self._recordings:
+            return self._recordings[id(glyphset)]
+
+        glyph = glyphset[glyphname]
+
+        recording = RecordingPen()
+        glyph.draw(recording)
+        decomposedRecording = DecomposingRecordingPen(glyphset)
+        glyph.draw(decomposedRecording)
+
+        # The decomposed recording has no components, so its control bounds
+        # are those of all its points; calcBounds gives (0, 0, 0, 0) if empty.
+        bounds = calcBounds(
+            [
+                pt
+                for _, args in decomposedRecording.value
+                for pt in args
+                if pt is not None
+            ]
+        )
+
+        result = (recording, decomposedRecording, bounds)
+        if cacheable:
+            self._recordings[id(glyphset)] = result
+        return result
+
+    def _split_contours(self, glyphset, recording):
+        perContourPen = PerContourOrComponentPen(RecordingPen, glyphset=glyphset)
+        recording.replay(perContourPen)
+        return perContourPen.value
+
     def draw_glyph(self, glyphset, glyphname, problems, which, *, x=0, y=0, scale=None):
         if type(problems) not in (list, tuple):
             problems = [problems]
@@ -847,18 +915,9 @@ class InterpolatablePlot:
         problem_types = set(problem["type"] for problem in problems)
         if not all(pt == problem_type for pt in problem_types):
             problem_type = "mixed"
-        glyph = glyphset[glyphname]
-
-        recording = RecordingPen()
-        glyph.draw(recording)
-        decomposedRecording = DecomposingRecordingPen(glyphset)
-        glyph.draw(decomposedRecording)
-
-        boundsPen = ControlBoundsPen(glyphset)
-        decomposedRecording.replay(boundsPen)
-        bounds = boundsPen.bounds
-        if bounds is None:
-            bounds = (0, 0, 0, 0)
+        recording, decomposedRecording, bounds = self._record_glyph(glyphset, glyphname)
+        # Split into contours on first use; several problems may need them.
+        contours = decomposedContours = None
 
         glyph_width = bounds[2] - bounds[0]
         glyph_height = bounds[3] - bounds[1]
@@ -887,40 +946,42 @@ class InterpolatablePlot:
         cr.translate(-bounds[0], -bounds[3])
 
         if self.border_color:
-            cr.set_source_rgb(*self.border_color)
+            cr.set_source(self._pattern(self.border_color))
             cr.rectangle(bounds[0], bounds[1], glyph_width, glyph_height)
             cr.set_line_width(self.border_width / scale)
             cr.stroke()
 
+        # One pen serves all the passes below; it only holds on to the
+        # context, and every contour starts with a moveTo.
+        pen = CairoPen(glyphset, cr)
+
         if self.fill_color or self.stroke_color:
-            pen = CairoPen(glyphset, cr)
             decomposedRecording.replay(pen)
 
             if self.fill_color and problem_type != InterpolatableProblem.OPEN_PATH:
-                cr.set_source_rgb(*self.fill_color)
+                cr.set_source(self._pattern(self.fill_color))
                 cr.fill_preserve()
 
             if self.stroke_color:
-                cr.set_source_rgb(*self.stroke_color)
+                cr.set_source(self._pattern(self.stroke_color))
                 cr.set_line_width(self.stroke_width / scale)
-                cr.stroke_preserve()
-
-            cr.new_path()
+                cr.stroke()
+            else:
+                cr.new_path()
 
         if (
             InterpolatableProblem.UNDERWEIGHT in problem_types
             or InterpolatableProblem.OVERWEIGHT in problem_types
         ):
-            perContourPen = PerContourOrComponentPen(RecordingPen, glyphset=glyphset)
-            recording.replay(perContourPen)
+            contours = self._split_contours(glyphset, recording)
             for problem in problems:
                 if problem["type"] in (
                     InterpolatableProblem.UNDERWEIGHT,
                     InterpolatableProblem.OVERWEIGHT,
                 ):
-                    contour = perContourPen.value[problem["contour"]]
-                    contour.replay(CairoPen(glyphset, cr))
-                    cr.set_source_rgba(*self.weight_issue_contour_color)
+                    contour = contours[problem["contour"]]
+                    contour.replay(pen)
+                    cr.set_source(self._pattern(self.weight_issue_contour_color))
                     cr.fill()
 
         if any(
@@ -932,51 +993,58 @@ class InterpolatablePlot:
             }
         ):
             cr.set_line_cap(cairo.LINE_CAP_ROUND)
+            value = decomposedRecording.value
 
-            # Oncurve nodes
-            for segment, args in decomposedRecording.value:
+            # Sort the nodes in one walk; each kind is stroked separately.
+            oncurve_pts = []
+            offcurve_pts = []
+            for segment, args in value:
                 if not args:
                     continue
-                x, y = args[-1]
-                cr.move_to(x, y)
-                cr.line_to(x, y)
-            cr.set_source_rgba(*self.oncurve_node_color)
+                oncurve_pts.append(args[-1])
+                offcurve_pts.extend(args[:-1])
+            move_to = cr.move_to
+            line_to = cr.line_to
+
+            # Oncurve nodes
+            for x, y in oncurve_pts:
+                move_to(x, y)
+                line_to(x, y)
+            cr.set_source(self._pattern(self.oncurve_node_color))
             cr.set_line_width(self.oncurve_node_diameter / scale)
             cr.stroke()
 
             # Offcurve nodes
-            for segment, args in decomposedRecording.value:
-                if not args:
-                    continue
-                for x, y in args[:-1]:
-                    cr.move_to(x, y)
-                    cr.line_to(x, y)
-            cr.set_source_rgba(*self.offcurve_node_color)
+            for x, y in offcurve_pts:
+                move_to(x, y)
+                line_to(x, y)
+            cr.set_source(self._pattern(self.offcurve_node_color))
             cr.set_line_width(self.offcurve_node_diameter / scale)
             cr.stroke()
 
             # Handles
-            for segment, args in decomposedRecording.value:
+            new_sub_path = cr.new_sub_path
+            for segment, args in value:
                 if not args:
                     pass
                 elif segment in ("moveTo", "lineTo"):
-                    cr.move_to(*args[0])
+                    move_to(*args[0])
                 elif segment == "qCurveTo":
                     for x, y in args:
-                        cr.line_to(x, y)
-                    cr.new_sub_path()
-                    cr.move_to(*args[-1])
+                        line_to(x, y)
+                    new_sub_path()
+                    move_to(*args[-1])
                 elif segment == "curveTo":
-                    cr.line_to(*args[0])
-                    cr.new_sub_path()
-                    cr.move_to(*args[1])
-                    cr.line_to(*args[2])
-                    cr.new_sub_path()
-                    cr.move_to(*args[-1])
+                    line_to(*args[0])
+                    new_sub_path()
+                    move_to(*args[1])
+                    line_to(*args[2])
+                    new_sub_path()
+                    move_to(*args[-1])
                 else:
                     continue
 
-            cr.set_source_rgba(*self.handle_color)
+            cr.set_source(self._pattern(self.handle_color))
             cr.set_line_width(self.handle_width / scale)
             cr.stroke()
 
@@ -984,17 +1052,15 @@ class InterpolatablePlot:
         for problem in problems:
             if problem["type"] == InterpolatableProblem.CONTOUR_ORDER:
                 matching = problem["value_2"]
-                colors = cycle(self.contour_colors)
-                perContourPen = PerContourOrComponentPen(
-                    RecordingPen, glyphset=glyphset
-                )
-                recording.replay(perContourPen)
-                for i, contour in enumerate(perContourPen.value):
+                colors = cycle(self._contour_patterns)
+                if contours is None:
+                    contours = self._split_contours(glyphset, recording)
+                for i, contour in enumerate(contours):
                     if matching[i] == i:
                         continue
-                    color = next(colors)
-                    contour.replay(CairoPen(glyphset, cr))
-                    cr.set_source_rgba(*color, self.contour_alpha)
+                    pattern = next(colors)
+                    contour.replay(pen)
+                    cr.set_source(pattern)
                     cr.fill()
 
         for problem in problems:
@@ -1006,13 +1072,13 @@ class InterpolatablePlot:
 
                 # Draw suggested point
                 if idx is not None and which == 1 and "value_2" in problem:
-                    perContourPen = PerContourOrComponentPen(
-                        RecordingPen, glyphset=glyphset
-                    )
-                    decomposedRecording.replay(perContourPen)
+                    if decomposedContours is None:
+                        decomposedContours = self._split_contours(
+                            glyphset, decomposedRecording
+                        )
                     points = SimpleRecordingPointPen()
                     converter = SegmentToPointPen(points, False)
-                    perContourPen.value[
+                    decomposedContours[
                         idx if matching is None else matching[idx]
                     ].replay(converter)
                     targetPoint = points.value[problem["value_2"]][0]
@@ -1047,18 +1113,13 @@ class InterpolatablePlot:
 
                     if idx is None or i == idx:
                         cr.save()
-                        first_pt = complex(*first_pt)
-                        second_pt = complex(*second_pt)
-                        length = abs(second_pt - first_pt)
-                        cr.translate(first_pt.real, first_pt.imag)
-                        if length:
+                        x1, y1 = first_pt
+                        dx = second_pt[0] - x1
+                        dy = second_pt[1] - y1
+                        cr.translate(x1, y1)
+                        if dx or dy:
                             # Draw arrowhead
-                            cr.rotate(
-                                math.atan2(
-                                    second_pt.imag - first_pt.imag,
-                                    second_pt.real - first_pt.real,
-                                )
-                            )
+                            cr.rotate(math.atan2(dy, dx))
                             cr.scale(1 / scale, 1 / scale)
                             self.draw_arrow(cr, color=color)
                         else:
@@ -1081,13 +1142,13 @@ class InterpolatablePlot:
 
             if problem["type"] == InterpolatableProblem.KINK:
                 idx = problem.get("contour")
-                perContourPen = PerContourOrComponentPen(
-                    RecordingPen, glyphset=glyphset
-                )
-                decomposedRecording.replay(perContourPen)
+                if decomposedContours is None:
+                    decomposedContours = self._split_contours(
+                        glyphset, decomposedRecording
+                    )
                 points = SimpleRecordingPointPen()
                 converter = SegmentToPointPen(points, False)
-                perContourPen.value[idx if matching is None else matching[idx]].replay(
+                decomposedContours[idx if matching is None else matching[idx]].replay(
                     converter
                 )
 
@@ -1118,9 +1179,7 @@ class InterpolatablePlot:
         cr.set_line_cap(cairo.LINE_CAP_ROUND)
         cr.move_to(x, y)
         cr.line_to(x, y)
-        if len(color) == 3:
-            color = color + (1,)
-        cr.set_source_rgba(*color)
+        cr.set_source(self._pattern(color))
         cr.stroke()
         cr.restore()
 
@@ -1131,17 +1190,13 @@ class InterpolatablePlot:
         cr.set_line_width(stroke_width)
         cr.set_line_cap(cairo.LINE_CAP_SQUARE)
         cr.arc(x, y, diameter / 2, 0, 2 * math.pi)
-        if len(color) == 3:
-            color = color + (1,)
-        cr.set_source_rgba(*color)
+        cr.set_source(self._pattern(color))
         cr.stroke()
         cr.restore()
 
     def draw_arrow(self, cr, *, x=0, y=0, color=(0, 0, 0)):
         cr.save()
-        if len(color) == 3:
-            color = color + (1,)
-        cr.set_source_rgba(*color)
+        cr.set_source(self._pattern(color))
         cr.translate(self.start_arrow_length + x, y)
         cr.move_to(0, 0)
         cr.line_to(
@@ -1162,22 +1217,26 @@ class InterpolatablePlot:
         if height is None:
             height = self.height
 
-        text = text.splitlines()
         cr = cairo.Context(self.surface)
         cr.set_source_rgb(*color)
         cr.set_font_size(self.font_size)
         cr.select_font_face(
             "@cairo:monospace", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL
         )
-        text_width = 0
-        text_height = 0
-        font_extents = cr.font_extents()
-        font_font_size = font_extents[2]
-        font_ascent = font_extents[0]
-        for line in text:
-            extents = cr.text_extents(line)
-            text_width = max(text_width, extents.x_advance)
-            text_height += font_font_size
+        # The same few texts (emoticons, the cupcake) are drawn on many pages.
+        key = (text, self.font_size)
+        metrics = self._text_metrics.get(key)
+        if metrics is None:
+            lines = text.splitlines()
+            font_extents = cr.font_extents()
+            metrics = self._text_metrics[key] = (
+                lines,
+                font_extents[2],
+                font_extents[0],
+                max((cr.text_extents(line).x_advance for line in lines), default=0),
+            )
+        text, font_font_size, font_ascent, text_width = metrics
+        text_height = font_font_size * len(text)
         if not text_width:
             return
         cr.translate(x, y)
@@ -171,6 +171,20 @@ def test_segmentPointAtT(segment, t, expectedPoint):
     assert expectedPoint == point
 
 
+@pytest.mark.parametrize(
+    "segment",
+    [
+        [(0.1, 0.2), (2.3, 0.3)],
+        [(0.1, 0.2), (0.3, 0.7), (0.2, 0.3)],
+        [(0.1, 0.2), (0.3, 0.7), (1.1, 0.9), (2.3, 0.3)],
+    ],
+)
+def test_segmentPointAtT_endpoints(segment):
+    # the end points are returned exactly, not just up to rounding
+    assert segmentPointAtT(segment, 0.0) == segment[0]
+    assert segmentPointAtT(segment, 1.0) == segment[-1]
+
+
 def test_intersections_straight_line():
     curve = ((548, 183), (548, 289), (450, 366), (315, 366))
     line1 = ((330, 376), (330, 286))
@@ -197,3 +211,111 @@ def test_intersections_linelike():
     seg2 = [(0.0, 0.5), (0.25, 0.5), (0.75, 0.5), (1.0, 0.5)]
     pt = curveCurveIntersections(seg1, seg2)[0][0]
     assert pt == (0.0, 0.5)
+
+
+def test_alignment_transformation_signed_zero():
+    # 0.0 == -0.0, but atan2() tells them apart
+    line1 = [(0.0, 0.0), (-0.0, 0.0)]
+    line2 = [(-0.0, 0.0), (-0.0, 0.0)]
+    assert bezierTools._alignment_transformation(
+        line1
+    ) != bezierTools._alignment_transformation(line2)
+
+
+@pytest.mark.parametrize(
+    "segment",
+    [
+        [(341, 553), (457, 753), (602, 1003)],
+        [(0, 0), (7, 3), (21, 9), (35, 15)],
+    ],
+)
+def test_is_linelike_collinear(segment):
+    assert bezierTools._is_linelike(segment)
+
+
+def test_intersections_collinear_curve():
+    seg1 = [(341, 553), (457, 753), (602, 1003)]
+    seg2 = [(300, 900), (500, 500), (700, 900)]
+    (intersection,) = curveCurveIntersections(seg1, seg2)
+    assert intersection.pt == pytest.approx((437.5647, 719.4908))
+    assert intersection.t1 == pytest.approx(0.3439117)
+    assert intersection.t2 == pytest.approx(0.3699796)
+
+
+def test_intersections_disjoint_bounds():
+    curve1 = [(10, 100), (90, 30), (40, 140), (220, 220)]
+    curve2 = [(305, 150), (480, 20), (380, 250), (510, 190)]
+    assert curveCurveIntersections(curve1, curve2) == []
+    # points given as lists rather than tuples
+    assert curveCurveIntersections([list(pt) for pt in curve1], curve2) == []
+
+
+@pytest.mark.parametrize(
+    "segment",
+    [
+        (0, 25 + 100j, 75 + 100j, 100),
+        (0, 50, 100 + 50j, 100 + 100j),
+        (0, 50, 100, -50),
+        (0, 50 + 100j, 100),
+        (0, 40, -40),
+    ],
+)
+def test_approximateArcLength_coefficients(segment):
+    if len(segment) == 4:
+        weights = bezierTools._CUBIC_LOBATTO_WEIGHTS
+        coeffs = bezierTools._CUBIC_LOBATTO_COEFFS
+        approximate = bezierTools.approximateCubicArcLengthC
+    else:
+        weights = bezierTools._QUADRATIC_LEGENDRE_WEIGHTS
+        coeffs = bezierTools._QUADRATIC_LEGENDRE_COEFFS
+        approximate = bezierTools.approximateQuadraticArcLengthC
+    expected = sum(
+        w * abs(sum(c * p for c, p in zip(row, segment)))
+        for w, row in zip(weights, coeffs)
+    )
+    assert approximate(*segment) == pytest.approx(expected)
+
+
+def test_approximateArcLengthBatch():
+    np = pytest.importorskip("numpy")
+    cubics = [
+        (0, 25 + 100j, 75 + 100j, 100),
+        (0, 50, 100 + 50j, 100 + 100j),
+        (0, 50, 100, -50),
+    ]
+    expected = [bezierTools.approximateCubicArcLengthC(*c) for c in cubics]
+    assert bezierTools.approximateCubicArcLengthBatch(cubics).tolist() == (
+        pytest.approx(expected)
+    )
+    quadratics = [(0, 50 + 100j, 100), (0, 100, 100 + 100j), (0, 40, -40)]
+    expected = [bezierTools.approximateQuadraticArcLengthC(*q) for q in quadratics]
+    assert bezierTools.approximateQuadraticArcLengthBatch(
+        np.array(quadratics)
+    ).tolist() == pytest.approx(expected)
+
+
+def test_curveCurveIntersectionsBatch():
+    pytest.importorskip("numpy")
+    curves1 = [
+        [(10, 100), (90, 30), (40, 140), (220, 220)],
+        [(0, 0), (50, 100), (100, 0)],
+        [(0, 0), (25, 100), (75, 100), (100, 0)],
+        [(0, 50), (50, 50), (100, 50)],
+    ]
+    curves2 = [
+        [(5, 150), (180, 20), (80, 250), (210, 190)],
+        [(0, 100), (50, 0), (100, 100)],
+        [(200, 0), (225, 100), (275, 100), (300, 0)],
+        [(0, 0), (25, 100), (75, 100), (100, 0)],
+    ]
+    results = bezierTools.curveCurveIntersectionsBatch(curves1, curves2)
+    assert len(results) == len(curves1)
+    for curve1, curve2, batch in zip(curves1, curves2, results):
+        expected = bezierTools.curveCurveIntersections(curve1, curve2)
+        assert len(batch) == len(expected)
+        for intersection in batch:
+            assert any(
+                intersection.t1 == pytest.approx(e.t1, abs=1e-2)
+                and intersection.t2 == pytest.approx(e.t2, abs=1e-2)
+                for e in expected
+            )
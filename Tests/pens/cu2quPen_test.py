@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
 import sys
 import unittest
 
@@ -208,6 +209,39 @@ class TestCu2QuPen(unittest.TestCase, _TestPenMixin):
             ],
         )
 
+    def test_curveTo_repeated(self):
+        # conversions are cached, but each curve is still drawn and counted
+        pen = DummyPen()
+        stats = {}
+        quadpen = Cu2QuPen(pen, MAX_ERR, stats=stats)
+        for _ in range(2):
+            quadpen.moveTo((0, 0))
+            quadpen.curveTo((1, 1), (2, 2), (3, 3))
+            quadpen.closePath()
+
+        self.assertEqual(
+            str(pen).splitlines(),
+            [
+                "pen.moveTo((0, 0))",
+                "pen.qCurveTo((0.75, 0.75), (2.25, 2.25), (3, 3))",
+                "pen.closePath()",
+            ]
+            * 2,
+        )
+        self.assertEqual(stats, {"2": 2})
+
+    def test_curveTo_signed_zero(self):
+        # 0.0 == -0.0, but the curves convert to different points
+        for x in (0.0, -0.0):
+            pen = RecordingPen()
+            quadpen = Cu2QuPen(pen, MAX_ERR)
+            quadpen.moveTo((10, 10))
+            quadpen.curveTo((5.0, 20.0), (0.0, 20.0), (x, 0.0))
+            quadpen.closePath()
+
+            _, points = pen.value[1]
+            self.assertEqual(math.copysign(1, points[-1][0]), math.copysign(1, x))
+
 
 class TestCu2QuPointPen(unittest.TestCase, _TestPenMixin):
     def __init__(self, *args, **kwargs):
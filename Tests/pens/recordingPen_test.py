@@ -2,6 +2,7 @@ from fontTools.pens.recordingPen import (
     RecordingPen,
     DecomposingRecordingPen,
     RecordingPointPen,
+    lerpRecordings,
 )
 import pytest
 
@@ -70,3 +71,34 @@ class RecordingPointPenTest:
         pen.replay(pen2)
 
         assert pen2.value == pen.value
+
+
+def test_lerpRecordings():
+    recording1 = [
+        ("moveTo", ((0, 0),)),
+        ("lineTo", ((0, 100),)),
+        ("curveTo", ((50, 75), (60, 50), (50, 0))),
+        ("qCurveTo", ((40, 0), (20, -20), (0, 0))),
+        ("qCurveTo", ((25, 25), (0, 50))),
+        ("closePath", ()),
+    ]
+    recording2 = [
+        ("moveTo", ((100, 100),)),
+        ("lineTo", ((100, 200),)),
+        ("curveTo", ((150, 175), (160, 150), (150, 100))),
+        ("qCurveTo", ((140, 100), (120, 80), (100, 100))),
+        ("qCurveTo", ((125, 125), (100, 150))),
+        ("closePath", ()),
+    ]
+
+    assert list(lerpRecordings(recording1, recording2, 0.25)) == [
+        ("moveTo", [(25, 25)]),
+        ("lineTo", [(25, 125)]),
+        ("curveTo", [(75, 100), (85, 75), (75, 25)]),
+        ("qCurveTo", [(65, 25), (45, 5), (25, 25)]),
+        ("qCurveTo", [(50, 50), (25, 75)]),
+        ("closePath", []),
+    ]
+
+    with pytest.raises(ValueError, match="Mismatched operations"):
+        list(lerpRecordings(recording1, recording2[::-1]))
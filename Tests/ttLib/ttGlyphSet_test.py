@@ -212,6 +212,11 @@ class TTGlyphSetTest(object):
 
         assert actual == expected, (locations, actual, expected)
 
+        # Drawing again reuses the source recordings
+        pen = RecordingPen()
+        glyph.draw(pen)
+        assert pen.value == expected
+
     def test_glyphset_varComposite_components(self):
         font = TTFont(self.getpath("varc-ac00-ac01.ttf"))
         glyphset = font.getGlyphSet()